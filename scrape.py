@@ -1,31 +1,78 @@
 import sys
 import os
 import re
-from PyPDF2 import PdfReader
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import fitz
+
+# Page banners and script marks, removed from the whole script text at once.
+# Whitespace in the header pattern must not span lines.
+_BANNER_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'SALMON #\d+[^\S\n]+XX/XX/\d+[^\S\n]+\d+\.?',  # Page headers
+    r'© \d+ MARVEL STUDIOS, INC\.',  # Copyright notice
+    r'NO DUPLICATION WITHOUT MARVEL’S WRITTEN CONSENT.',  # Copyright warning
+    r'\(CONTINUED\)',  # Continued marks
+    r'CONTINUED:',  # Continued marks at start of page
+    r'\(MORE\)',  # More marks
+]), re.IGNORECASE)
+
+# Page numbers to remove once the marks are gone, so that a number left behind
+# by a removed mark (e.g. "17 (CONTINUED)") is still caught. Every alternative
+# needs a digit as the last non-space character.
+_PAGE_NUMBER_RE = re.compile('|'.join(f'(?:{p})' for p in [
+    r'^\d+\s*$',  # Standalone page numbers
+    r'\d+\s+\d+$',  # Page transition numbers (like "17 17")
+    r'^\s*\d+\s+\d+\s*$',  # Page numbers on their own line
+]))
+
+# Character name (in caps), optionally followed by a parenthetical like (V.O.)
+_CHAR_MATCH = re.compile(r'^(?:THE\s+)?([A-Z][A-Z\s\']+)(?:\s*\([^)]+\))?\s*$')
+
+# Numbered lines (like "1.", "2.", etc.)
+_NUMBERED = re.compile(r'^\d+\.')
+
+# Marker for a character's dialogue continuing after an interruption
+_CONTD = "(cont'd)"
+
+# Short all-caps words that are still allowed in dialogue
+_COMMON_EXCLAMATIONS = frozenset({'NO', 'YES', 'OH', 'AH', 'HEY', 'HI', 'OK', 'GO', 'STOP', 'WAIT', 'WOW'})
+
+# Punctuation stripped from words before the all-caps check
+_PUNCT = ',.!?-_'
+
+# Common script elements that aren't dialogue
+_NON_DIALOG_RE = re.compile('|'.join(re.escape(indicator) for indicator in [
+    'FADE IN:',
+    'FADE OUT',
+    'CUT TO:',
+    'DISSOLVE TO:',
+    'SMASH CUT',
+    'QUICK CUT',
+    'MATCH CUT',
+    'TITLE OVER',
+    'SUPER:',
+    'INT.',
+    'EXT.',
+    'CONTINUED:',
+    'ANGLE ON',
+    'SCENE',
+    'ACT'
+]), re.IGNORECASE)
 
 def clean_line(line):
     """
-    Clean a line by removing script formatting marks, page numbers, and copyright notices.
+    Clean a line by removing page numbers. Script formatting marks and copyright
+    notices are expected to be removed from the page text with _BANNER_RE beforehand.
     """
-    # Patterns to remove
-    patterns = [
-        r'SALMON #\d+\s+XX/XX/\d+\s+\d+\.?',  # Page headers
-        r'© \d+ MARVEL STUDIOS, INC\.',  # Copyright notice
-        r'NO DUPLICATION WITHOUT MARVEL’S WRITTEN CONSENT.',  # Copyright warning
-        r'\(CONTINUED\)',  # Continued marks
-        r'CONTINUED:',  # Continued marks at start of page
-        r'\(MORE\)',  # More marks
-        r'^\d+\s*$',  # Standalone page numbers
-        r'\d+\s+\d+$',  # Page transition numbers (like "17 17")
-        r'^\s*\d+\s+\d+\s*$',  # Page numbers on their own line
-    ]
-    
-    # Apply each pattern
-    cleaned_line = line
-    for pattern in patterns:
-        cleaned_line = re.sub(pattern, '', cleaned_line, flags=re.IGNORECASE)
-    
-    return cleaned_line.strip()
+    # Blank lines need no regex work
+    if not line or line.isspace():
+        return ''
+
+    # Only lines ending in a digit can hold a page number
+    if line.rstrip()[-1:].isdigit():
+        line = _PAGE_NUMBER_RE.sub('', line)
+
+    return line.strip()
 
 def is_valid_dialogue_line(line, current_character=None):
     """
@@ -34,49 +81,31 @@ def is_valid_dialogue_line(line, current_character=None):
     
     Args:
         line (str): The line to check
-        current_character (str): The current speaking character's name, if known
+        current_character (str): The current speaking character's name (uppercase), if known
     """
     line = line.strip()
     
     # Check if any word in the line is all caps (excluding short exclamations)
-    words = line.split()
-    common_exclamations = {'NO', 'YES', 'OH', 'AH', 'HEY', 'HI', 'OK', 'GO', 'STOP', 'WAIT', 'WOW'}
-    for word in words:
-        # Skip punctuation-only words and common exclamations
-        if (word.strip(',.!?-_') and 
-            len(word.strip(',.!?-_')) > 2 and  # Skip very short words
-            word.strip(',.!?-_').isupper() and 
-            word.strip(',.!?-_') not in common_exclamations):
+    for word in line.split():
+        # Lowercase words can't be all caps once punctuation is stripped
+        if word.islower():
+            continue
+        w = word.strip(_PUNCT)
+        # Skip very short words (including punctuation-only ones) and common exclamations
+        if len(w) > 2 and w.isupper() and w not in _COMMON_EXCLAMATIONS:
             return False
         
     # Check for numbered lines (like "1.", "2.", etc.)
-    if re.match(r'^\d+\.', line):
+    if _NUMBERED.match(line):
         return False
         
-    # Check if the line contains the current speaker's name (if provided)
-    if current_character and current_character.upper() in line.upper():
+    # Additional checks for common script elements that aren't dialogue
+    if _NON_DIALOG_RE.search(line):
         return False
         
-    # Additional checks for common script elements that aren't dialogue
-    non_dialogue_indicators = [
-        'FADE IN:',
-        'FADE OUT',
-        'CUT TO:',
-        'DISSOLVE TO:',
-        'SMASH CUT',
-        'QUICK CUT',
-        'MATCH CUT',
-        'TITLE OVER',
-        'SUPER:',
-        'INT.',
-        'EXT.',
-        'CONTINUED:',
-        'ANGLE ON',
-        'SCENE',
-        'ACT'
-    ]
-    
-    if any(indicator in line.upper() for indicator in non_dialogue_indicators):
+    # Check if the line contains the current speaker's name (if provided); done
+    # last since it is the only check that allocates an uppercased copy of the line
+    if current_character and current_character in line.upper():
         return False
         
     return True
@@ -87,79 +116,87 @@ def extract_dialogues(pdf_path, characters):
     Returns a dictionary with character names as keys and their dialogues as values.
     """
     character_dialogues = {char.upper(): [] for char in characters}
-    reader = PdfReader(pdf_path)
+    
+    # Extract all page text up front so the parser runs in a single pass
+    # and dialogue can carry across page boundaries
+    with fitz.open(pdf_path) as doc:
+        text = "\n".join(page.get_text("text") for page in doc)
+    
+    # Drop page headers, copyright banners and (MORE)/(CONTINUED) marks in one
+    # pass before splitting, so clean_line only has page numbers left to handle
+    lines = _BANNER_RE.sub('', text).split('\n')
+    
+    # Bound append methods, looked up once per speaker change rather than per flush
+    appenders = {char: dialogues.append for char, dialogues in character_dialogues.items()}
     
     current_character = None
     current_dialogue = []
+    append_dialogue = None
     
-    for page in reader.pages:
-        text = page.extract_text()
-        lines = text.split('\n')
-        
-        i = 0
-        while i < len(lines):
-            line = clean_line(lines[i])
-            
-            if not line:  # Skip empty lines
-                i += 1
-                continue
-                
-            # Check for character name (in caps) followed by dialogue
-            character_match = re.match(r'^(?:THE\s+)?([A-Z][A-Z\s\']+)(?:\s*\([^)]+\))?\s*$', line) 
-            
-            if character_match:
-                # Save previous dialogue if exists
-                if current_character and current_dialogue:
-                    if current_character in character_dialogues:
-                        cleaned_dialogue = ' '.join(current_dialogue).strip()
-                        if cleaned_dialogue:  # Only add non-empty dialogues
-                            character_dialogues[current_character].append(cleaned_dialogue)
-                    current_dialogue = []
-                
-                # Get new character name
-                current_character = character_match.group(1).strip()
-                
-                # Move to next line which should be dialogue
-                i += 1
-                if i < len(lines):
-                    dialogue_line = clean_line(lines[i])
-                    if dialogue_line and is_valid_dialogue_line(dialogue_line, current_character):
-                        current_dialogue.append(dialogue_line)
+    def flush_dialogue():
+        # Dialogue lines come from clean_line already stripped and non-empty
+        if current_dialogue and append_dialogue:
+            append_dialogue(' '.join(current_dialogue))
+    
+    # Clean lines lazily in C-level iteration; the lookahead below pulls the
+    # next cleaned line from the same iterator
+    cleaned_lines = map(clean_line, lines)
+    
+    for line in cleaned_lines:
+        if not line:  # Skip empty lines
+            continue
             
-            # Handle continued dialogue
-            elif current_character and line.endswith("(cont'd)"):
-                character_name = line.replace("(cont'd)", "").strip()
-                if character_name.upper() == current_character:
-                    i += 1
-                    if i < len(lines):
-                        dialogue_line = clean_line(lines[i])
-                        if dialogue_line and is_valid_dialogue_line(dialogue_line, current_character):
-                            current_dialogue.append(dialogue_line)
+        # Check for character name (in caps) followed by dialogue; names always
+        # start with an ASCII capital, so skip the regex for anything else
+        character_match = _CHAR_MATCH.match(line) if 'A' <= line[0] <= 'Z' else None
+        
+        if character_match:
+            # Save previous dialogue if exists
+            flush_dialogue()
+            current_dialogue = []
             
-            # Add to current dialogue if we're in the middle of one
-            elif current_character and current_dialogue and line:
-                if is_valid_dialogue_line(line, current_character):
-                    current_dialogue.append(line)
-                else:
-                    # This is a non-dialogue line, so save current dialogue and reset
-                    if current_character in character_dialogues:
-                        cleaned_dialogue = ' '.join(current_dialogue).strip()
-                        if cleaned_dialogue:
-                            character_dialogues[current_character].append(cleaned_dialogue)
-                    current_dialogue = []
-                    current_character = None
+            # Get new character name
+            current_character = character_match.group(1).strip()
+            append_dialogue = appenders.get(current_character)
             
-            i += 1
-    
+            # Move to next line which should be dialogue
+            dialogue_line = next(cleaned_lines, '')
+            if dialogue_line and is_valid_dialogue_line(dialogue_line, current_character):
+                current_dialogue.append(dialogue_line)
+        
+        # Handle continued dialogue
+        elif current_character and line.endswith(_CONTD):
+            character_name = line[:-len(_CONTD)].strip()
+            if character_name.upper() == current_character:
+                dialogue_line = next(cleaned_lines, '')
+                if dialogue_line and is_valid_dialogue_line(dialogue_line, current_character):
+                    current_dialogue.append(dialogue_line)
+        
+        # Add to current dialogue if we're in the middle of one
+        elif current_character and current_dialogue and line:
+            if is_valid_dialogue_line(line, current_character):
+                current_dialogue.append(line)
+            else:
+                # This is a non-dialogue line, so save current dialogue and reset
+                flush_dialogue()
+                current_dialogue = []
+                current_character = None
+                append_dialogue = None
+
     # Save any remaining dialogue
-    if current_character and current_dialogue:
-        if current_character in character_dialogues:
-            cleaned_dialogue = ' '.join(current_dialogue).strip()
-            if cleaned_dialogue:
-                character_dialogues[current_character].append(cleaned_dialogue)
+    flush_dialogue()
     
     return character_dialogues
 
+def extract_dialogues_corpus(pdf_paths, characters):
+    """
+    Extract dialogues for specified characters from several script PDFs in parallel.
+    Returns a list of character dialogue dictionaries, one per PDF, in the same order as pdf_paths.
+    """
+    max_workers = min(len(pdf_paths), os.cpu_count() or 1) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(partial(extract_dialogues, characters=characters), pdf_paths))
+
 
 # def extract_dialogues(pdf_path, characters):
 #     """
@@ -223,39 +260,55 @@ def save_dialogues(character_dialogues, output_dir):
     for character, dialogues in character_dialogues.items():
         if dialogues:  # Only create file if character has dialogues
             filename = os.path.join(output_dir, f"{character.lower()}_dialogues.txt")
-            with open(filename, 'w', encoding='utf-8') as f:
-                for dialogue in dialogues:
-                    f.write(f"{dialogue}\n\n")  # Just write the dialogue with double spacing
+            with open(filename, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                f.write("\n\n".join(dialogues) + "\n\n")  # Just write the dialogue with double spacing
 
 def main():
     if len(sys.argv) < 3:
-        print("Usage: python script.py input.pdf character1 character2 ...")
+        print("Usage: python script.py input.pdf|input_dir character1 character2 ...")
         sys.exit(1)
     
-    pdf_path = sys.argv[1]
+    input_path = sys.argv[1]
     characters = sys.argv[2:]
     
-    if not os.path.exists(pdf_path):
-        print(f"Error: PDF file '{pdf_path}' not found.")
+    if not os.path.exists(input_path):
+        print(f"Error: PDF file or directory '{input_path}' not found.")
         sys.exit(1)
     
+    # A directory is treated as a corpus of scripts
+    if os.path.isdir(input_path):
+        pdf_paths = sorted(
+            os.path.join(input_path, name)
+            for name in os.listdir(input_path)
+            if name.lower().endswith('.pdf')
+        )
+        if not pdf_paths:
+            print(f"Error: no PDF files found in '{input_path}'.")
+            sys.exit(1)
+    else:
+        pdf_paths = [input_path]
+    
     try:
         # Extract dialogues
-        character_dialogues = extract_dialogues(pdf_path, characters)
-        
-        # Create output directory based on PDF filename
-        output_dir = os.path.splitext(pdf_path)[0] + "_dialogues"
+        if len(pdf_paths) == 1:
+            results = [extract_dialogues(pdf_paths[0], characters)]
+        else:
+            results = extract_dialogues_corpus(pdf_paths, characters)
         
-        # Save dialogues to files
-        save_dialogues(character_dialogues, output_dir)
-        
-        print(f"Dialogues extracted successfully to '{output_dir}' directory.")
-        
-        # Print summary
-        for character in characters:
-            char_upper = character.upper()
-            count = len(character_dialogues.get(char_upper, []))
-            print(f"{character}: {count} dialogues extracted")
+        for pdf_path, character_dialogues in zip(pdf_paths, results):
+            # Create output directory based on PDF filename
+            output_dir = os.path.splitext(pdf_path)[0] + "_dialogues"
+            
+            # Save dialogues to files
+            save_dialogues(character_dialogues, output_dir)
+            
+            print(f"Dialogues extracted successfully to '{output_dir}' directory.")
+            
+            # Print summary
+            for character in characters:
+                char_upper = character.upper()
+                count = len(character_dialogues.get(char_upper, []))
+                print(f"{character}: {count} dialogues extracted")
     
     except Exception as e:
         print(f"Error processing PDF: {str(e)}")